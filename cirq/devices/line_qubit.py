@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copyreg
 import functools
-from typing import List
+from typing import Dict, Iterable, List
 
 from cirq import ops, protocols
 
+# LineQubits with coordinates in [-_INTERNED_RANGE, _INTERNED_RANGE] are
+# interned, so repeatedly constructing small registers reuses the same objects.
+_INTERNED_RANGE = 1024
+
 
 @functools.total_ordering
 class LineQubit(ops.Qid):
@@ -35,16 +40,89 @@ class LineQubit(ops.Qid):
         cirq.LineQubit(1)
     """
 
+    __slots__ = ('x',)
+
+    x: int
+
+    _interned: Dict[int, 'LineQubit'] = {}
+    _JSON_KEYS = ('x',)
+
+    def __new__(cls, x: int, *args, **kwargs) -> 'LineQubit':
+        """Returns a line qubit at the given x coordinate.
+
+        Extra arguments are accepted, and ignored, so that subclasses can
+        take additional constructor arguments in their own `__init__`.
+        """
+        if (cls is LineQubit and type(x) is int and
+                -_INTERNED_RANGE <= x <= _INTERNED_RANGE):
+            qubit = LineQubit._interned.get(x)
+            if qubit is None:
+                qubit = LineQubit._interned[x] = super().__new__(cls)
+                object.__setattr__(qubit, 'x', x)
+            return qubit
+        qubit = super().__new__(cls)
+        object.__setattr__(qubit, 'x', x)
+        return qubit
+
     def __init__(self, x: int) -> None:
         """Initializes a line qubit at the given x coordinate."""
-        self.x = x
+        # x was already set by __new__, which may return an interned qubit.
+
+    # Line qubits are shared between callers, so x must not be mutated.
+    # Other attributes, e.g. those of subclasses, are left alone.
+    def __setattr__(self, name, value):
+        if name == 'x':
+            raise AttributeError('LineQubit is immutable. Cannot set x.')
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if name == 'x':
+            raise AttributeError('LineQubit is immutable. Cannot delete x.')
+        super().__delattr__(name)
+
+    def __reduce__(self):
+        # Rebuild through __new__ (not __init__, whose signature subclasses
+        # may change) and restore any subclass attributes, whether they live
+        # in a __dict__ or in slots.
+        state = getattr(self, '__dict__', None)
+        slot_state = {}
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name in ('x', '__dict__', '__weakref__'):
+                    continue
+                if name.startswith('__') and not name.endswith('__'):
+                    name = f'_{cls.__name__.lstrip("_")}{name}'
+                if hasattr(self, name):
+                    slot_state[name] = getattr(self, name)
+        if slot_state:
+            state = (state, slot_state)
+        return copyreg.__newobj__, (type(self), self.x), state
 
     def _comparison_key(self):
         return self.x
 
+    # Fast paths for comparing line qubits with each other, bypassing the
+    # generic tuple-based comparison inherited from `cirq.Qid`.
+    def __hash__(self):
+        return hash(self.x)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self.x == other.x
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        if type(other) is type(self):
+            return self.x != other.x
+        return super().__ne__(other)
+
     def is_adjacent(self, other: ops.Qid) -> bool:
         """Determines if two qubits are adjacent line qubits."""
-        return isinstance(other, LineQubit) and abs(self.x - other.x) == 1
+        if not isinstance(other, LineQubit):
+            return False
+        diff = self.x - other.x
+        return diff == 1 or diff == -1
 
     @staticmethod
     def range(*range_args) -> List['LineQubit']:
@@ -56,25 +134,42 @@ class LineQubit(ops.Qid):
         Returns:
             A list of line qubits.
         """
-        return [LineQubit(i) for i in range(*range_args)]
+        return list(map(LineQubit, range(*range_args)))
+
+    @staticmethod
+    def shift(qubits: Iterable['LineQubit'], offset: int) -> List['LineQubit']:
+        """Returns the given line qubits, each moved along the line by offset.
+
+        Equivalent to `[q + offset for q in qubits]`.
+
+        Args:
+            qubits: The line qubits to shift.
+            offset: The integer amount to add to each qubit's x coordinate.
+
+        Returns:
+            A list of line qubits.
+        """
+        if not isinstance(offset, int):
+            raise TypeError(
+                f'Can only shift LineQubits by ints. Instead was {offset!r}')
+        return list(map(LineQubit, [q.x + offset for q in qubits]))
 
     def __repr__(self):
-        return 'cirq.LineQubit({})'.format(self.x)
+        return f'cirq.LineQubit({self.x})'
 
     def __str__(self):
-        return '{}'.format(self.x)
+        return f'{self.x}'
 
     def __add__(self, other: int) -> 'LineQubit':
         if not isinstance(other, int):
             raise TypeError(
-                'Can only add ints and LineQubits. Instead was {}'.format(
-                    other))
+                f'Can only add ints and LineQubits. Instead was {other!r}')
         return LineQubit(self.x + other)
 
     def __sub__(self, other: int) -> 'LineQubit':
         if not isinstance(other, int):
-            raise TypeError('Can only subtract ints and LineQubits. Instead was'
-                            '{}'.format(other))
+            raise TypeError(
+                f'Can only subtract ints and LineQubits. Instead was {other!r}')
         return LineQubit(self.x - other)
 
     def __radd__(self, other: int) -> 'LineQubit':
@@ -87,4 +182,4 @@ class LineQubit(ops.Qid):
         return LineQubit(-self.x)
 
     def _json_dict_(self):
-        return protocols.to_json_dict(self, ['x'])
+        return protocols.to_json_dict(self, LineQubit._JSON_KEYS)
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
+
 import pytest
 
 import cirq
@@ -22,11 +25,88 @@ def test_init():
     assert q.x == 1
 
 
+def test_interned():
+    assert cirq.LineQubit(3) is cirq.LineQubit(3)
+    assert cirq.LineQubit(-2) is cirq.LineQubit(1) - 3
+    assert cirq.LineQubit.range(2)[1] is cirq.LineQubit(1)
+    assert cirq.LineQubit(10**6) is not cirq.LineQubit(10**6)
+    assert cirq.LineQubit(10**6) == cirq.LineQubit(10**6)
+    assert cirq.LineQubit(1.5).x == 1.5
+
+
+class _LabeledLineQubit(cirq.LineQubit):
+
+    def __init__(self, x, label):
+        super().__init__(x)
+        self.label = label
+
+
+class _SlottedLineQubit(cirq.LineQubit):
+    __slots__ = ('y', '__z', 'unset')
+
+    def __init__(self, x, y, z):
+        super().__init__(x)
+        self.y = y
+        self.__z = z
+
+    @property
+    def z(self):
+        return self.__z
+
+
+def test_subclass():
+    q = _LabeledLineQubit(3, 'a')
+    assert type(q) is _LabeledLineQubit
+    assert q.x == 3
+    assert q.label == 'a'
+    q.label = 'b'
+    assert q.label == 'b'
+    with pytest.raises(AttributeError, match='immutable'):
+        q.x = 4
+    assert q is not _LabeledLineQubit(3, 'a')
+    assert q != cirq.LineQubit(3)
+    assert cirq.LineQubit(3) is cirq.LineQubit(3)
+
+
+def test_copy_and_pickle():
+    q = cirq.LineQubit(4)
+    assert copy.copy(q) is q
+    assert copy.deepcopy(q) is q
+    assert pickle.loads(pickle.dumps(q)) is q
+    big = cirq.LineQubit(10**6)
+    assert pickle.loads(pickle.dumps(big)) == big
+
+    labeled = _LabeledLineQubit(2, 'a')
+    for other in [
+            copy.copy(labeled),
+            copy.deepcopy(labeled),
+            pickle.loads(pickle.dumps(labeled))
+    ]:
+        assert type(other) is _LabeledLineQubit
+        assert other.x == 2
+        assert other.label == 'a'
+
+    slotted = _SlottedLineQubit(5, 9, 7)
+    for other in [
+            copy.copy(slotted),
+            copy.deepcopy(slotted),
+            pickle.loads(pickle.dumps(slotted)),
+            pickle.loads(pickle.dumps(slotted, protocol=0))
+    ]:
+        assert type(other) is _SlottedLineQubit
+        assert not hasattr(other, '__dict__')
+        assert (other.x, other.y, other.z) == (5, 9, 7)
+        assert not hasattr(other, 'unset')
+
+
 def test_eq():
     eq = cirq.testing.EqualsTester()
     eq.make_equality_group(lambda: cirq.LineQubit(1))
     eq.add_equality_group(cirq.LineQubit(2))
     eq.add_equality_group(cirq.LineQubit(0))
+    eq.add_equality_group(cirq.LineQubit(10**6))
+    eq.add_equality_group(cirq.GridQubit(0, 0))
+    eq.add_equality_group(cirq.NamedQubit('0'))
 
 
 def test_str():
@@ -61,6 +141,9 @@ def test_is_adjacent():
     assert cirq.LineQubit(2).is_adjacent(cirq.LineQubit(3))
     assert not cirq.LineQubit(1).is_adjacent(cirq.LineQubit(3))
     assert not cirq.LineQubit(2).is_adjacent(cirq.LineQubit(0))
+    assert not cirq.LineQubit(1).is_adjacent(cirq.LineQubit(1))
+    assert not cirq.LineQubit(1).is_adjacent(cirq.GridQubit(0, 0))
+    assert not cirq.LineQubit(1).is_adjacent(cirq.NamedQubit('q'))
 
 
 def test_range():
@@ -105,6 +188,25 @@ def test_addition_subtraction_type_error():
         _ = cirq.LineQubit(1) - 'dave'
 
 
+def test_shift():
+    assert cirq.LineQubit.shift([], 3) == []
+    assert cirq.LineQubit.shift(cirq.LineQubit.range(3),
+                                2) == cirq.LineQubit.range(2, 5)
+    assert cirq.LineQubit.shift(
+        [cirq.LineQubit(5), cirq.LineQubit(1)],
+        -2) == [cirq.LineQubit(3), cirq.LineQubit(-1)]
+    with pytest.raises(TypeError, match='dave'):
+        _ = cirq.LineQubit.shift(cirq.LineQubit.range(2), 'dave')
+
+
+def test_shift_subclass():
+    labeled = [_LabeledLineQubit(1, 'a'), _LabeledLineQubit(4, 'b')]
+    shifted = _LabeledLineQubit.shift(labeled, 1)
+    assert shifted == [q + 1 for q in labeled]
+    assert all(type(q) is cirq.LineQubit for q in shifted)
+    assert shifted == [cirq.LineQubit(2), cirq.LineQubit(5)]
+
+
 def test_neg():
     assert -cirq.LineQubit(1) == cirq.LineQubit(-1)
 
@@ -114,3 +216,19 @@ def test_json_dict():
         'cirq_type': 'LineQubit',
         'x': 5,
     }
+
+
+def test_slots():
+    q = cirq.LineQubit(1)
+    assert not hasattr(q, '__dict__')
+    with pytest.raises(AttributeError):
+        q.y = 2
+
+
+def test_immutable():
+    q = cirq.LineQubit(1)
+    with pytest.raises(AttributeError, match='immutable'):
+        q.x = 2
+    with pytest.raises(AttributeError, match='immutable'):
+        del q.x
+    assert q.x == 1
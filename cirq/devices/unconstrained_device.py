@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Optional
+
 from cirq import value, protocols
 from cirq.devices import device
 
@@ -20,20 +22,30 @@ from cirq.devices import device
 class _UnconstrainedDevice(device.Device):
     """A device that allows everything, infinitely fast."""
 
-    def duration_of(self, operation):
-        return value.Duration(picos=0)
+    _instance: Optional['_UnconstrainedDevice'] = None
+    _ZERO_DURATION = value.Duration(picos=0)
 
-    def validate_operation(self, operation):
-        pass
+    def __new__(cls):
+        # Stateless, so every construction shares a single instance. The
+        # instance is looked up per class so subclasses get their own.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
 
-    def validate_scheduled_operation(self, schedule, scheduled_operation):
-        pass
+    def duration_of(self, operation):
+        return self._ZERO_DURATION
 
-    def validate_circuit(self, circuit):
+    def _validate_nothing(self, *args, **kwargs):
         pass
 
-    def validate_schedule(self, schedule):
-        pass
+    # Everything is valid, so all validation methods share the same no-op.
+    # This includes validate_moment, skipping the default per-operation loop.
+    validate_operation = _validate_nothing
+    validate_scheduled_operation = _validate_nothing
+    validate_moment = _validate_nothing
+    validate_circuit = _validate_nothing
+    validate_schedule = _validate_nothing
 
     def __repr__(self):
         return 'cirq.UNCONSTRAINED_DEVICE'
@@ -42,7 +54,7 @@ class _UnconstrainedDevice(device.Device):
         return ()
 
     def _json_dict_(self):
-        return protocols.to_json_dict(self, [])
+        return protocols.to_json_dict(self, ())
 
 
 UNCONSTRAINED_DEVICE: device.Device = _UnconstrainedDevice()
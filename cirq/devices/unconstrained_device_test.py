@@ -22,3 +22,43 @@ def test_repr():
 def test_infinitely_fast():
     assert cirq.UNCONSTRAINED_DEVICE.duration_of(cirq.X(
         cirq.NamedQubit('a'))) == cirq.Duration(picos=0)
+    assert cirq.UNCONSTRAINED_DEVICE.duration_of(cirq.X(cirq.NamedQubit(
+        'a'))) is cirq.UNCONSTRAINED_DEVICE.duration_of(cirq.Y(
+            cirq.NamedQubit('b')))
+
+
+def test_singleton():
+    device = cirq.devices.unconstrained_device._UnconstrainedDevice()
+    assert device is cirq.UNCONSTRAINED_DEVICE
+
+
+class _SubclassedDevice(cirq.devices.unconstrained_device._UnconstrainedDevice):
+    pass
+
+
+def test_subclass_singleton():
+    device = _SubclassedDevice()
+    assert type(device) is _SubclassedDevice
+    assert device is _SubclassedDevice()
+    assert device is not cirq.UNCONSTRAINED_DEVICE
+
+
+def test_validates_everything():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit.from_ops(cirq.CZ(a, b), cirq.X(a))
+    schedule = cirq.moment_by_moment_schedule(cirq.UNCONSTRAINED_DEVICE,
+                                              circuit)
+    device = cirq.UNCONSTRAINED_DEVICE
+    device.validate_operation(cirq.CZ(a, b))
+    device.validate_moment(circuit[0])
+    device.validate_circuit(circuit)
+    device.validate_schedule(schedule)
+    for scheduled_operation in schedule.scheduled_operations:
+        device.validate_scheduled_operation(schedule, scheduled_operation)
+
+    device.validate_operation(operation=cirq.CZ(a, b))
+    device.validate_moment(moment=circuit[0])
+    device.validate_circuit(circuit=circuit)
+    device.validate_schedule(schedule=schedule)
+    device.validate_scheduled_operation(
+        schedule=schedule, scheduled_operation=scheduled_operation)
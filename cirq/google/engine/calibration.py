@@ -13,19 +13,26 @@
 # limitations under the License.
 """Calibration wrapper for calibrations returned from the Quantum Engine."""
 
-from collections import abc, defaultdict
+import functools
+import itertools
+from collections import abc
+from types import MappingProxyType
 
-from typing import Any, Dict, Tuple
+from typing import (Any, Dict, ItemsView, KeysView, List, Mapping, Tuple,
+                    ValuesView)
 
 from cirq import devices, vis
 
+# The values of a single metric, keyed by the qubits the metric applies to.
+_MetricValues = Mapping[Tuple[devices.GridQubit, ...], Any]
+
 
 class Calibration(abc.Mapping):
     """A convenience wrapper for calibrations that acts like a dictionary.
 
     Calibrations act as dictionaries whose keys are the names of the metric,
     and whose values are the metric values.  The metric values themselves are
-    represented as a dictionary.  These metric value dictionaries have
+    represented as a read-only mapping.  These metric value mappings have
     keys that are tuples of `cirq.GridQubit`s and values that are lists of the
     metric values for those qubits. If a metric acts globally and is attached
     to no specified number of qubits, the map will be from the empty tuple
@@ -49,46 +56,67 @@ class Calibration(abc.Mapping):
         self.timestamp = int(calibration['timestampMs'])
         self._metric_dict = self._compute_metric_dict(calibration['metrics'])
 
-    def _compute_metric_dict(
-            self, metrics: Dict
-    ) -> Dict[str, Dict[Tuple[devices.GridQubit, ...], Any]]:
-        results: Dict[str, Dict[Tuple[devices.
-                                      GridQubit, ...], Any]] = defaultdict(dict)
+    def __getstate__(self) -> Dict[str, Any]:
+        # MappingProxyType can't be pickled, so unwrap the metric views.
+        state = self.__dict__.copy()
+        state['_metric_dict'] = {
+            name: dict(metric) for name, metric in self._metric_dict.items()
+        }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state['_metric_dict'] = {
+            name: MappingProxyType(metric)
+            for name, metric in state['_metric_dict'].items()
+        }
+        self.__dict__.update(state)
+
+    def _compute_metric_dict(self, metrics: Dict) -> Dict[str, _MetricValues]:
+        # Metrics repeatedly reference the same qubits, so parse each target
+        # id only once per calibration.
+        @functools.lru_cache(maxsize=None)
+        def target_to_qubit(target: str) -> devices.GridQubit:
+            # TODO: Remove 'q' stripping when calibrations don't prepend it.
+            return devices.GridQubit.from_proto_id(
+                target[1:] if target[:1] == 'q' else target)
+
+        # Group (qubits, values) pairs by metric name, then build each metric's
+        # dictionary in a single pass.
+        grouped: Dict[str, List[Tuple[Tuple[devices.GridQubit, ...], Any]]] = {}
         for metric in metrics:
             name = metric['name']
+            entries = grouped.setdefault(name, [])
             # Flatten the values to a list, removing keys containing type names
             # (e.g. proto version of each value is {<type>: value}).
-            flat_values = [v[t] for v in metric['values'] for t in v]
-            if 'targets' in metric:
-                targets = [
-                    t[1:] if t.startswith('q') else t for t in metric['targets']
-                ]
-                # TODO: Remove when calibrations don't prepend this.
-                qubits = tuple(
-                    devices.GridQubit.from_proto_id(t) for t in targets)
-                results[name][qubits] = flat_values
+            flat_values = list(
+                itertools.chain.from_iterable(
+                    v.values() for v in metric['values']))
+            targets = metric.get('targets')
+            if targets is not None:
+                qubits = tuple(map(target_to_qubit, targets))
+                entries.append((qubits, flat_values))
             else:
-                assert len(results[name]) == 0, (
+                assert len(entries) == 0, (
                     'Only one metric of a given name can have no targets. '
                     'Found multiple for key {}'.format(name))
-                results[name][()] = flat_values
-        return results
+                entries.append(((), flat_values))
+        return {
+            name: MappingProxyType(dict(entries))
+            for name, entries in grouped.items()
+        }
 
-    def __getitem__(self, key: str) -> Dict[Tuple[devices.GridQubit, ...], Any]:
+    def __getitem__(self, key: str) -> _MetricValues:
         """Supports getting calibrations by index.
 
         Calibration may be accessed by key:
 
             `calibration['t1']`.
 
-        This returns a map from tuples of `cirq.GridQubit`s to a list of the
-        values of the metric. If there are no targets, the only key will only
-        be an empty tuple.
+        This returns a read-only map from tuples of `cirq.GridQubit`s to a list
+        of the values of the metric. If there are no targets, the only key will
+        only be an empty tuple.
         """
-        if not isinstance(key, str):
-            raise TypeError(
-                'Calibration metrics only have string keys. Key was {}'.format(
-                    key))
+        _check_key(key)
         if key not in self._metric_dict:
             raise KeyError('Metric named {} not in calibration'.format(key))
         return self._metric_dict[key]
@@ -99,13 +127,46 @@ class Calibration(abc.Mapping):
     def __len__(self):
         return len(self._metric_dict)
 
+    # Delegate lookups directly to the underlying dict rather than going
+    # through the `abc.Mapping` fallbacks built on `__getitem__`.
+    def __contains__(self, key: object) -> bool:
+        _check_key(key)
+        return key in self._metric_dict
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns the metric named key, or default if there is no such metric.
+
+        Like indexing and `in`, raises a TypeError if key is not a string.
+        """
+        _check_key(key)
+        return self._metric_dict.get(key, default)
+
+    def keys(self) -> KeysView[str]:
+        return self._metric_dict.keys()
+
+    def values(self) -> ValuesView[_MetricValues]:
+        return self._metric_dict.values()
+
+    def items(self) -> ItemsView[str, _MetricValues]:
+        return self._metric_dict.items()
+
     def heatmap(self, key: str) -> vis.Heatmap:
         metrics = self[key]
-        assert all(len(k) == 1 for k in metrics.keys()), (
-            'Heatmaps are only supported if all the targets in a metric'
-            ' are single qubits.')
-        assert all(len(k) == 1 for k in metrics.values()), (
-            'Heatmaps are only supported if all the values in a metric'
-            ' are single metric values.')
-        value_map = {qubit: value for (qubit,), (value,) in metrics.items()}
+        value_map: Dict[devices.GridQubit, Any] = {}
+        for qubits, values in metrics.items():
+            if len(qubits) != 1:
+                raise ValueError(
+                    'Heatmaps are only supported if all the targets in a metric'
+                    ' are single qubits.')
+            if len(values) != 1:
+                raise ValueError(
+                    'Heatmaps are only supported if all the values in a metric'
+                    ' are single metric values.')
+            value_map[qubits[0]] = values[0]
         return vis.Heatmap(value_map)
+
+
+def _check_key(key: Any) -> None:
+    if not isinstance(key, str):
+        raise TypeError(
+            'Calibration metrics only have string keys. Key was {}'.format(key))
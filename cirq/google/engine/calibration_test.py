@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
+
 import pytest
 
 import matplotlib as mpl
@@ -76,17 +79,62 @@ def test_calibration_metrics_dictionary():
 
     assert 't1' in calibration
     assert 't2' not in calibration
+    assert set(calibration.keys()) == {'xeb', 't1', 'globalMetric'}
+    assert calibration.get('t1') == t1s
+    assert calibration.get('t2') is None
+    assert calibration.get('t2', 5) == 5
+    assert dict(calibration.items())['t1'] == t1s
+    assert len(list(calibration.values())) == 3
 
     for qubits, values in t1s.items():
         assert len(qubits) == 1
         assert len(values) == 1
 
+    with pytest.raises(TypeError):
+        t1s[(cirq.GridQubit(0, 0),)] = [0]
+
     with pytest.raises(TypeError, match="was 1"):
         _ = calibration[1]
+    with pytest.raises(TypeError, match="was 1"):
+        _ = calibration.get(1)
+    with pytest.raises(TypeError, match="was 1"):
+        _ = 1 in calibration
     with pytest.raises(KeyError, match='notit'):
         _ = calibration['notit']
 
 
+def test_calibration_metrics_without_targets():
+    calibration = cg.Calibration(_CALIBRATION_DATA)
+    assert calibration['globalMetric'] == {(): [12300]}
+    assert calibration['xeb'] == {
+        (cirq.GridQubit(0, 0), cirq.GridQubit(0, 1)): [.9999],
+        (cirq.GridQubit(0, 0), cirq.GridQubit(1, 0)): [.9998],
+    }
+
+    duplicated = dict(_CALIBRATION_DATA)
+    duplicated['metrics'] = _CALIBRATION_DATA['metrics'] + [{
+        'name': 'globalMetric',
+        'values': [{
+            'floatVal': 1
+        }]
+    }]
+    with pytest.raises(AssertionError, match='globalMetric'):
+        _ = cg.Calibration(duplicated)
+
+
+def test_calibration_pickle_and_deepcopy():
+    calibration = cg.Calibration(_CALIBRATION_DATA)
+    for other in [
+            pickle.loads(pickle.dumps(calibration)),
+            copy.deepcopy(calibration)
+    ]:
+        assert other == calibration
+        assert other.timestamp == calibration.timestamp
+        assert other['t1'] == calibration['t1']
+        with pytest.raises(TypeError):
+            other['t1'][(cirq.GridQubit(0, 0),)] = [0]
+
+
 def test_calibration_heatmap():
     calibration = cg.Calibration(_CALIBRATION_DATA)
 
@@ -94,3 +142,19 @@ def test_calibration_heatmap():
     figure = mpl.figure.Figure()
     axes = figure.add_subplot(111)
     heatmap.plot(axes)
+
+    with pytest.raises(ValueError, match='single qubits'):
+        _ = calibration.heatmap('xeb')
+
+    multi_value = dict(_CALIBRATION_DATA)
+    multi_value['metrics'] = [{
+        'name': 't1',
+        'targets': ['q0_0'],
+        'values': [{
+            'doubleVal': 321
+        }, {
+            'doubleVal': 322
+        }]
+    }]
+    with pytest.raises(ValueError, match='single metric values'):
+        _ = cg.Calibration(multi_value).heatmap('t1')
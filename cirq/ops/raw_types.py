@@ -38,6 +38,9 @@ class Qid(metaclass=abc.ABCMeta):
     comparison, and hashing methods via `_comparison_key`.
     """
 
+    # Allow child classes to opt into `__slots__` and drop their `__dict__`.
+    __slots__ = ()
+
     @abc.abstractmethod
     def _comparison_key(self) -> Any:
         """Returns a value used to sort and compare this qubit with others.